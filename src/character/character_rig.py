@@ -11,10 +11,105 @@ project_root = os.path.abspath(os.path.join(current_dir, "../.."))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+import io
+from bisect import bisect_right
+import numpy as np
 import pygame
-import random
+import struct
 import time
+from typing import Optional
 from src.core.bone_system import Bone, Transform, SpriteVariant
+from src.core.skeleton import Skeleton
+
+
+def _is_fully_opaque(surf: pygame.Surface) -> bool:
+    """Check whether every pixel of a freshly loaded image is fully opaque"""
+    if not surf.get_flags() & pygame.SRCALPHA:
+        return True
+    w, h = surf.get_size()
+    return pygame.mask.from_surface(surf, 254).count() == w * h
+
+
+def _to_display_format(surf: pygame.Surface, opaque: bool = False) -> pygame.Surface:
+    """
+    Convert a surface to display format (fast blit path) once a display exists.
+    Every sprite handed to a bone goes through here, loaded or placeholder.
+    """
+    if pygame.display.get_surface() is None:
+        return surf
+    # Opaque layers take SDL's solid-copy blitter instead of per-pixel alpha
+    return surf.convert() if opaque else surf.convert_alpha()
+
+
+# Process-wide cache of decoded, display-converted sprites
+# ((absolute path, never_rotated) -> Surface).
+# Rigs only blit these, so the same Surface is shared between instances. Only
+# converted surfaces go in: before set_mode() images are decoded uncached.
+_IMAGE_CACHE = {}
+
+
+# Keep a raw RGBA copy of every decoded sprite next to its PNG (<name>.png.rgba) and
+# load that instead on later launches, skipping zlib/libpng entirely. Meant for
+# shipped builds; leave off while editing art (stale copies are detected by mtime).
+RAW_SPRITE_CACHE = False
+RAW_SPRITE_SUFFIX = ".rgba"
+
+
+def _read_raw_sprite(path: str) -> Optional[pygame.Surface]:
+    """Return the raw-RGBA copy of a PNG if one exists and is newer than the PNG"""
+    raw_path = path + RAW_SPRITE_SUFFIX
+    try:
+        if os.path.getmtime(raw_path) < os.path.getmtime(path):
+            return None
+        with open(raw_path, 'rb') as f:
+            w, h = struct.unpack('<II', f.read(8))
+            return pygame.image.frombuffer(f.read(), (w, h), 'RGBA')
+    except (OSError, struct.error, ValueError, pygame.error):
+        return None
+
+
+def _write_raw_sprite(path: str, img: pygame.Surface):
+    """Store a decoded sprite as (width, height, RGBA bytes); best effort"""
+    try:
+        with open(path + RAW_SPRITE_SUFFIX, 'wb') as f:
+            f.write(struct.pack('<II', *img.get_size()))
+            f.write(pygame.image.tostring(img, 'RGBA'))
+    except OSError as e:
+        print(f"Warning: Could not write raw sprite cache for {path}: {e}")
+
+
+def _decode_image(path: str) -> pygame.Surface:
+    """Read and decode a PNG (no display conversion)"""
+    if RAW_SPRITE_CACHE:
+        img = _read_raw_sprite(path)
+        if img is not None:
+            return img
+    
+    # One sequential read, then decode from memory (namehint picks the PNG loader)
+    with open(path, 'rb') as f:
+        data = f.read()
+    img = pygame.image.load(io.BytesIO(data), path)
+    
+    if RAW_SPRITE_CACHE:
+        _write_raw_sprite(path, img)
+    return img
+
+
+def get_image(path: str, never_rotated: bool = False) -> pygame.Surface:
+    """
+    Load an image once per process and return the cached display-format surface.
+    never_rotated lets a fully opaque image drop its alpha channel; only for
+    sprites that are never drawn rotated, since rotate() pads an alpha-less
+    surface with a solid colour.
+    """
+    key = (os.path.abspath(path), never_rotated)
+    surf = _IMAGE_CACHE.get(key)
+    if surf is None:
+        img = _decode_image(key[0])
+        surf = _to_display_format(img, opaque=never_rotated and _is_fully_opaque(img))
+        if pygame.display.get_surface() is not None:
+            _IMAGE_CACHE[key] = surf
+    return surf
 
 
 class CharacterRig:
@@ -23,27 +118,65 @@ class CharacterRig:
     This is the main interface for animating your character.
     """
     
-    def __init__(self, assets_dir: str):
+    # Single sprite picked from a folder of alternatives
+    EYEBROWS_SPRITE = "eyebrows/Stan_Eyebrows0003.png"
+    # Angle granularity (degrees) of the pre-rotated arm and hand sprites
+    ARM_ROTATION_STEP = 5.0
+    
+    def __init__(self, assets_dir: str, verbose: bool = False):
         """
         Initialize character rig and load all assets.
+        
+        Args:
+            assets_dir: Folder containing the character sprites
+            verbose: If True, print loading progress and list every loaded variant / missing file
         """
         self.assets_dir = assets_dir
+        self.verbose = verbose
         self.root = None  
         
         self.bones = {}
+        self._index_assets()
         self._load_assets()
         self._build_skeleton()
         self._init_animation_systems()
     
-    def _load_image(self, relative_path: str) -> pygame.Surface:
-        """Helper to load an image"""
+    def _log(self, message: str):
+        """Progress output, only in verbose mode (warnings are always printed)"""
+        if self.verbose:
+            print(message)
+    
+    def _index_assets(self):
+        """
+        Walk assets_dir once and record every PNG per folder.
+        Later lookups hit this index instead of stat-ing / listing the disk again.
+        """
+        # folder relative to assets_dir ('.' for the top level) -> PNG filenames
+        self._asset_index = {}
+        if not os.path.isdir(self.assets_dir):
+            print(f"Warning: Assets directory not found: {self.assets_dir}")
+            return
+        
+        count = 0
+        for dirpath, dirnames, filenames in os.walk(self.assets_dir):
+            # Skip archived art that the rig never loads
+            dirnames[:] = [d for d in dirnames if d != "not_use"]
+            pngs = [f for f in filenames if f.endswith('.png')]
+            if pngs:
+                self._asset_index[os.path.relpath(dirpath, self.assets_dir)] = pngs
+                count += len(pngs)
+        print(f"Indexed {count} images in {len(self._asset_index)} folders")
+    
+    def _load_image(self, relative_path: str, never_rotated: bool = False) -> pygame.Surface:
+        """Helper to load an image (never_rotated: see get_image)"""
         path = os.path.join(self.assets_dir, relative_path)
-        if not os.path.exists(path):
-            print(f"Warning: Image not found: {path}")
+        folder, filename = os.path.split(relative_path)
+        if filename not in self._asset_index.get(os.path.normpath(folder), ()):
+            self._missing_images.append(path)
             surf = pygame.Surface((50, 50), pygame.SRCALPHA)
             surf.fill((255, 0, 255, 128)) 
-            return surf
-        return pygame.image.load(path).convert_alpha()
+            return _to_display_format(surf)
+        return get_image(path, never_rotated)
     
     def _load_asset_variants(self, folder: str, prefix: str = "") -> dict:
         """
@@ -53,42 +186,44 @@ class CharacterRig:
         variants = {}
         full_path = os.path.join(self.assets_dir, folder)
         
-        if not os.path.exists(full_path):
-            print(f"Warning: Folder not found: {full_path}")
+        filenames = self._asset_index.get(os.path.normpath(folder))
+        if filenames is None:
+            print(f"Warning: No images found in folder: {full_path}")
             return variants
         
-        for filename in os.listdir(full_path):
-            if filename.endswith('.png') and filename.startswith(prefix):
-                name = os.path.splitext(filename)[0]
-                variants[name] = self._load_image(os.path.join(folder, filename))
-        
+        for filename in filenames:
+            if filename.startswith(prefix):
+                # Indexed files are known to exist, skip the exists() check
+                variants[filename[:-4]] = get_image(os.path.join(full_path, filename))
+
         return variants
     
     def _load_assets(self):
         """Load all character sprites"""
-        print("Loading character assets...")
+        self._log("Loading character assets...")
+        self._missing_images = []  # reported once at the end
         
-        # Core body parts
-        self.body_sprite = self._load_image('body.png')
+        # Core body parts. Body, collar, legs and feet hang off the body bone,
+        # which only ever scales; face and hat turn with set_head_rotation
+        self.body_sprite = self._load_image('body.png', never_rotated=True)
         self.face_sprite = self._load_image('face.png')
         self.hat_sprite = self._load_image('hat.png')
-        self.collar_sprite = self._load_image('collar.png')
-        self.legs_sprite = self._load_image('legs.png')
-        self.feet_sprite = self._load_image('feet.png') 
+        self.collar_sprite = self._load_image('collar.png', never_rotated=True)
+        self.legs_sprite = self._load_image('legs.png', never_rotated=True)
+        self.feet_sprite = self._load_image('feet.png', never_rotated=True) 
         
         # --- Load eye variants from folder ---
         eye_variants = self._load_asset_variants("eyes")
         if eye_variants:
             default_key = list(eye_variants.keys())[0]
             self.eye_variants = SpriteVariant(eye_variants, default=default_key)
-            print(f"  ✅ Loaded {len(eye_variants)} eye variants from 'eyes/' folder:")
-            for name in eye_variants.keys():
-                print(f"     - {name}")
+            self._log(f"  ✅ Loaded {len(eye_variants)} eye variants from 'eyes/' folder")
+            self._log("     - " + ", ".join(eye_variants))
         else:
             print("  ⚠️  No eye variants found in 'eyes/' folder, creating placeholder")
             placeholder = pygame.Surface((50, 20), pygame.SRCALPHA)
             pygame.draw.ellipse(placeholder, (0, 0, 0), (0, 0, 50, 20))
-            self.eye_variants = SpriteVariant({'default': placeholder})
+            self.eye_variants = SpriteVariant({'default': _to_display_format(placeholder)})
         
         # --- Load mouth variants from folder ---
         mouth_variants = self._load_asset_variants("mouth")
@@ -105,7 +240,7 @@ class CharacterRig:
             print("  ⚠️  No mouth variants found in 'mouth/' folder, creating placeholder")
             placeholder = pygame.Surface((30, 15), pygame.SRCALPHA)
             pygame.draw.line(placeholder, (0, 0, 0), (0, 7), (30, 7), 2)
-            self.mouth_variants = SpriteVariant({'default': placeholder})
+            self.mouth_variants = SpriteVariant({'default': _to_display_format(placeholder)})
 
 
         self.l_arm_upper_sprite = self._load_image('arms/left_upperarm.png') 
@@ -115,32 +250,54 @@ class CharacterRig:
 
         hand_variants = self._load_asset_variants("hands")
         
-        l_hand_dict = {k: v for k, v in hand_variants.items() if k.startswith('L_')}
-        r_hand_dict = {k: v for k, v in hand_variants.items() if k.startswith('R_')}
+        # Split into left/right sets in a single pass
+        l_hand_dict, r_hand_dict = {}, {}
+        for k, v in hand_variants.items():
+            if k.startswith('L_'):
+                l_hand_dict[k] = v
+            elif k.startswith('R_'):
+                r_hand_dict[k] = v
         
         if l_hand_dict:
             self.l_hand_variants = SpriteVariant(l_hand_dict, default=list(l_hand_dict.keys())[0])
-            print(f"  ✅ Loaded {len(l_hand_dict)} left hand variants.")
+            self._log(f"  ✅ Loaded {len(l_hand_dict)} left hand variants.")
         else:
             print("  ⚠️  No left hand variants found.")
-            self.l_hand_variants = SpriteVariant({'default': pygame.Surface((20, 20), pygame.SRCALPHA)})
+            self.l_hand_variants = SpriteVariant({'default': _to_display_format(pygame.Surface((20, 20), pygame.SRCALPHA))})
             
         if r_hand_dict:
             self.r_hand_variants = SpriteVariant(r_hand_dict, default=list(r_hand_dict.keys())[0])
-            print(f"  ✅ Loaded {len(r_hand_dict)} right hand variants.")
+            self._log(f"  ✅ Loaded {len(r_hand_dict)} right hand variants.")
         else:
             print("  ⚠️  No right hand variants found.")
-            self.r_hand_variants = SpriteVariant({'default': pygame.Surface((20, 20), pygame.SRCALPHA)})
+            self.r_hand_variants = SpriteVariant({'default': _to_display_format(pygame.Surface((20, 20), pygame.SRCALPHA))})
         
-        self.eyebrows_sprite = self._load_image('eyebrows/Stan_Eyebrows0003.png')
+        self.eyebrows_sprite = self._load_image(self.EYEBROWS_SPRITE)
 
-        print("Assets loaded successfully!")
+        if self._missing_images:
+            print(f"Warning: {len(self._missing_images)} image(s) not found, using placeholders")
+            if self.verbose:
+                print("\n".join(f"     - {path}" for path in self._missing_images))
+        
+        self._log("Assets loaded successfully!")
     
     def _build_skeleton(self):
         """
         Build the complete bone hierarchy.
         """
-        print("Building skeleton...")
+        self._log("Building skeleton...")
+        
+        # Sprite sizes that position the joints below, read once
+        body_w, body_h = self.body_sprite.get_size()
+        l_upper_h = self.l_arm_upper_sprite.get_height()
+        l_forearm_h = self.l_arm_forearm_sprite.get_height()
+        r_upper_h = self.r_arm_upper_sprite.get_height()
+        r_forearm_h = self.r_arm_forearm_sprite.get_height()
+        legs_h = self.legs_sprite.get_height()
+        face_h = self.face_sprite.get_height()
+        
+        # Rest height of the head; set_head_position_offset bobs around it
+        self._head_base_y = -body_h // 2 - 100
         
         # --- ROOT (screen anchor point) ---
         self.root = Bone(
@@ -151,13 +308,13 @@ class CharacterRig:
         # --- BODY (main torso) ---
         body_bone = Bone(
             name="Body",
-            local_transform=Transform(position=(0, 0)),
+            local_transform=Transform(),
             sprite=None,
             anchor_point=(0.5, 0.5)
         )
         self.root.add_child(body_bone)
         
-        body_half_width = self.body_sprite.get_width() // 2
+        body_half_width = body_w // 2
 
         # =========================================================
         # --- LEFT ARM (Shoulder -> Elbow -> Hand) ---
@@ -175,7 +332,7 @@ class CharacterRig:
         # 2. Elbow_L 
         forearm_L = Bone(
             name="Elbow_L",
-            local_transform=Transform(position=(4, self.l_arm_upper_sprite.get_height()-25), rotation=10),
+            local_transform=Transform(position=(4, l_upper_h-25), rotation=10),
             sprite=self.l_arm_forearm_sprite, 
             anchor_point=(0.6, 0.15) 
         )
@@ -184,7 +341,7 @@ class CharacterRig:
         # 3. Hand_L 
         hand_L = Bone(
             name="Hand_L",
-            local_transform=Transform(position=(11, self.l_arm_forearm_sprite.get_height()-16)),
+            local_transform=Transform(position=(11, l_forearm_h-16)),
             sprite=self.l_hand_variants.get_sprite(),
             anchor_point=(0.5, 0.5)
         )
@@ -206,7 +363,7 @@ class CharacterRig:
         # 2. Elbow_R 
         forearm_R = Bone(
             name="Elbow_R",
-            local_transform=Transform(position=(-4, self.r_arm_upper_sprite.get_height()-24), rotation=-10),
+            local_transform=Transform(position=(-4, r_upper_h-24), rotation=-10),
             sprite=self.r_arm_forearm_sprite, 
             anchor_point=(0.4, 0.15) 
         )
@@ -215,7 +372,7 @@ class CharacterRig:
         # 3. Hand_R 
         hand_R = Bone(
             name="Hand_R",
-            local_transform=Transform(position=(-11, self.r_arm_forearm_sprite.get_height()-16)),
+            local_transform=Transform(position=(-11, r_forearm_h-16)),
             sprite=self.r_hand_variants.get_sprite(),
             anchor_point=(0.5, 0.5) 
         )
@@ -224,7 +381,7 @@ class CharacterRig:
         # --- LEGS ---
         legs_bone = Bone(
             name="Legs",
-            local_transform=Transform(position=(0, self.body_sprite.get_height() // 2 - 35)),
+            local_transform=Transform(position=(0, body_h // 2 - 35)),
             sprite=self.legs_sprite,
             anchor_point=(0.5, 0.0)
         )
@@ -232,7 +389,7 @@ class CharacterRig:
 
         feet_bone = Bone(
             name="Feet",
-            local_transform=Transform(position=(0, self.legs_sprite.get_height() - 8)), # 假设脚在腿的底部
+            local_transform=Transform(position=(0, legs_h - 8)), # 假设脚在腿的底部
             sprite=self.feet_sprite,
             anchor_point=(0.5, 1) 
         )
@@ -241,7 +398,7 @@ class CharacterRig:
         # --- BODY SPRITE ---
         body_sprite_bone = Bone(
             name="BodySprite",
-            local_transform=Transform(position=(0, 0)),
+            local_transform=Transform(),
             sprite=self.body_sprite,
             anchor_point=(0.5, 0.5)
         )
@@ -259,7 +416,7 @@ class CharacterRig:
         # --- HEAD ---
         head_bone = Bone(
             name="Head",
-            local_transform=Transform(position=(0, -self.body_sprite.get_height() // 2 - 100)),
+            local_transform=Transform(position=(0, self._head_base_y)),
             sprite=None,
             anchor_point=(0.5, 0.5)
         )
@@ -268,7 +425,7 @@ class CharacterRig:
         # --- FACE ---
         face_bone = Bone(
             name="Face",
-            local_transform=Transform(position=(0, 0)),
+            local_transform=Transform(),
             sprite=self.face_sprite,
             anchor_point=(0.5, 0.5)
         )
@@ -277,7 +434,7 @@ class CharacterRig:
         # --- HAT ---
         hat_bone = Bone(
             name="Hat",
-            local_transform=Transform(position=(0, -self.face_sprite.get_height() // 2 + 200)),
+            local_transform=Transform(position=(0, -face_h // 2 + 200)),
             sprite=self.hat_sprite,
             anchor_point=(0.5, 1.0)
         )
@@ -314,114 +471,186 @@ class CharacterRig:
         
         # Cache bone references
         self._cache_bones()
-        print(f"Skeleton built with {len(self.bones)} bones")
+        
+        # Direct references for the setters called every frame
+        self._body_bone = body_bone
+        self._head_bone = head_bone
+        self._eyes_bone = eyes_bone
+        self._mouth_bone = mouth_bone
+        self._eyebrow_bone = eyebrows_bone
+        # Keyed by the exact strings the effectors pass; other spellings fall back below
+        self._arms = {"left": (shoulder_L, forearm_L), "right": (shoulder_R, forearm_R)}
+        # Arms and hands rotate every frame from a small sprite set; reuse each angle once rendered
+        for bone in (shoulder_L, forearm_L, shoulder_R, forearm_R):
+            bone.use_rotation_atlas(self.ARM_ROTATION_STEP)
+        hand_L.use_rotation_atlas(self.ARM_ROTATION_STEP, variants=self.l_hand_variants)
+        hand_R.use_rotation_atlas(self.ARM_ROTATION_STEP, variants=self.r_hand_variants)
+        self._arms["L"], self._arms["R"] = self._arms["left"], self._arms["right"]
+        self._hands = {"left": (self.l_hand_variants, hand_L), "right": (self.r_hand_variants, hand_R)}
+        self._log(f"Skeleton built with {len(self.bones)} bones")
     
     def _cache_bones(self):
         """Build a dictionary of all bones for easy access"""
-        def add_to_cache(bone):
-            self.bones[bone.name] = bone
-            for child in bone.children:
-                add_to_cache(child)
-        
-        add_to_cache(self.root)
+        # Flat breadth-first arrays that update() runs the transform pass over
+        self.skeleton = Skeleton(self.root)
+        self.bones = {bone.name: bone for bone in self.skeleton.bones}
     
     def _init_animation_systems(self):
         """初始化眨眼和时间线动画系统"""
         self.blink_enabled = True
-        self.last_blink_time = time.time()
-        self.next_blink_interval = random.uniform(2.0, 5.0)
+        self.last_blink_time = time.perf_counter()
+        self.min_blink_interval = 2.0
+        self.max_blink_interval = 5.0
+        # Blink randomness is drawn in batches (see _blink_random)
+        self._rng = np.random.default_rng()
+        self._blink_samples = []
+        self.next_blink_interval = self._pick_blink_interval()
         self.is_blinking = False
         self.blink_start_time = 0.0
         self.blink_duration = 0.15
         
-        all_eye_variants = list(self.eye_variants.variants.keys())
-        self.blink_eyes = [e for e in ["close", "close2", "close3"] if e in all_eye_variants]
-        if not self.blink_eyes and all_eye_variants:
-            self.blink_eyes = [e for e in all_eye_variants if "close" in e.lower()]
-        if not self.blink_eyes:
-            self.blink_eyes = ["1_center"]
-        
+        eye_idx = self.eye_variants.name_to_idx
         self.normal_eye = "1_center"
+        if self.normal_eye not in eye_idx:
+            print(f"Warning: No '{self.normal_eye}' eye variant, "
+                  f"using '{self.eye_variants.default}' as the open eye")
+            self.normal_eye = self.eye_variants.default
+        
+        self.blink_eyes = (
+            tuple(e for e in ("close", "close2", "close3") if e in eye_idx)
+            or tuple(e for e in self.eye_variants.names if "close" in e.lower())
+            or (self.normal_eye,)
+        )
+        self._blink_eye_indices = tuple(eye_idx[e] for e in self.blink_eyes)
         
         self.eye_timeline_enabled = False
         self.eye_timeline = []
         self.eye_timeline_start_time = 0.0
+        self._eye_starts, self._eye_ends, self._last_eye_idx = [], [], -1
         
         self.mouth_timeline_enabled = False
         self.mouth_timeline = []
         self.mouth_timeline_start_time = 0.0
+        self._mouth_starts, self._mouth_ends, self._last_mouth_idx = [], [], -1
+        self._mouth_viseme_idx = []
+        
+        # First skeleton pass up front (also JIT-compiles the bone kernel when numba is present)
+        self.skeleton.update()
         
-        print("  ✅ Animation systems initialized")
+        self._log("  ✅ Animation systems initialized")
+    
+    def _blink_random(self) -> float:
+        """Next uniform [0, 1) sample, refilled 256 at a time from the numpy generator"""
+        if not self._blink_samples:
+            self._blink_samples = self._rng.random(256).tolist()
+        return self._blink_samples.pop()
     
-    def update_blink_animation(self):
+    def _pick_blink_interval(self) -> float:
+        lo, hi = self.min_blink_interval, self.max_blink_interval
+        return lo + (hi - lo) * self._blink_random()
+    
+    def _pick_blink_eye(self) -> int:
+        return self._blink_eye_indices[int(self._blink_random() * len(self._blink_eye_indices))]
+    
+    def update_blink_animation(self, now=None):
         
         if not self.blink_enabled:
             return
         
-        current_time = time.time()
+        current_time = time.perf_counter() if now is None else now
         
         if not self.is_blinking:
             if current_time - self.last_blink_time >= self.next_blink_interval:
                 self.is_blinking = True
                 self.blink_start_time = current_time
-                if self.blink_eyes:
-                    self.set_eye_variant(random.choice(self.blink_eyes))
+                self.set_eye_variant_idx(self._pick_blink_eye())
         else:
             if current_time - self.blink_start_time >= self.blink_duration:
                 self.is_blinking = False
                 self.last_blink_time = current_time
-                self.next_blink_interval = random.uniform(2.0, 5.0)
+                self.next_blink_interval = self._pick_blink_interval()
                 self.set_eye_variant(self.normal_eye)
     
-    def update_eye_timeline(self, current_time=None):
+    @staticmethod
+    def _find_segment(starts, ends, t, last_idx):
+        """
+        Index of the segment with starts[i] <= t < ends[i], or -1.
+        Checks last_idx first (the usual case frame to frame), then binary-searches.
+        """
+        if 0 <= last_idx < len(starts) and starts[last_idx] <= t < ends[last_idx]:
+            return last_idx
+        i = bisect_right(starts, t) - 1
+        if i >= 0 and t < ends[i]:
+            return i
+        return -1
+    
+    def update_eye_timeline(self, current_time=None, now=None):
         if not self.eye_timeline_enabled or not self.eye_timeline:
             return
         
         if current_time is None:
-            current_time = time.time() - self.eye_timeline_start_time
+            if now is None:
+                now = time.perf_counter()
+            current_time = now - self.eye_timeline_start_time
         
-        for seg in self.eye_timeline:
-            if seg["start"] <= current_time < seg["start"] + seg["duration"]:
-                if not self.is_blinking:
-                    self.normal_eye = seg["variant"]
-                    self.set_eye_variant(seg["variant"])
-                break
+        i = self._find_segment(self._eye_starts, self._eye_ends, current_time, self._last_eye_idx)
+        if i < 0:
+            return
+        self._last_eye_idx = i
+        if not self.is_blinking:
+            seg = self.eye_timeline[i]
+            self.normal_eye = seg["variant"]
+            self.set_eye_variant(seg["variant"])
     
     def update_mouth_timeline(self, current_time):
         if not self.mouth_timeline_enabled or not self.mouth_timeline:
             return
         
-        for seg in self.mouth_timeline:
-            if seg["start"] <= current_time < seg["end"]:
-                self.set_mouth_variant(seg["viseme"])
-                break
+        i = self._find_segment(self._mouth_starts, self._mouth_ends, current_time, self._last_mouth_idx)
+        if i >= 0:
+            self._last_mouth_idx = i
+            viseme_idx = self._mouth_viseme_idx[i]
+            if viseme_idx >= 0:
+                self.set_mouth_variant_idx(viseme_idx)
 
     def start_manual_blink(self):
         self.is_blinking = True
-        self.blink_start_time = time.time()
-        if self.blink_eyes:
-            self.set_eye_variant(random.choice(self.blink_eyes))
+        self.blink_start_time = time.perf_counter()
+        self.set_eye_variant_idx(self._pick_blink_eye())
     
     def toggle_auto_blink(self):
         self.blink_enabled = not self.blink_enabled
         return self.blink_enabled
     
     def set_blink_interval(self, min_interval, max_interval):
-        self.next_blink_interval = random.uniform(min_interval, max_interval)
+        """Set the range the gap between blinks is drawn from (applies from the next blink)"""
+        self.min_blink_interval = min_interval
+        self.max_blink_interval = max_interval
     
     def load_eye_timeline(self, timeline_data, auto_start=True):
+        """Segments are {"variant", "start", "duration"}, sorted by start and non-overlapping"""
         self.eye_timeline = timeline_data
+        self._eye_starts = [seg["start"] for seg in timeline_data]
+        self._eye_ends = [seg["start"] + seg["duration"] for seg in timeline_data]
+        self._last_eye_idx = -1
         self.eye_timeline_enabled = auto_start
         if auto_start:
-            self.eye_timeline_start_time = time.time()
-        print(f"  ✅ Loaded eye timeline with {len(timeline_data)} segments")
+            self.eye_timeline_start_time = time.perf_counter()
+        self._log(f"  ✅ Loaded eye timeline with {len(timeline_data)} segments")
     
     def load_mouth_timeline(self, timeline_data, auto_start=True):
+        """Segments are {"viseme", "start", "end"}, sorted by start and non-overlapping"""
         self.mouth_timeline = timeline_data
+        self._mouth_starts = [seg["start"] for seg in timeline_data]
+        self._mouth_ends = [seg["end"] for seg in timeline_data]
+        # Visemes resolved to sprite indices once; -1 for shapes this character lacks
+        name_to_idx = self.mouth_variants.name_to_idx
+        self._mouth_viseme_idx = [name_to_idx.get(seg["viseme"], -1) for seg in timeline_data]
+        self._last_mouth_idx = -1
         self.mouth_timeline_enabled = auto_start
         if auto_start:
-            self.mouth_timeline_start_time = time.time()
-        print(f"  ✅ Loaded mouth timeline with {len(timeline_data)} segments")
+            self.mouth_timeline_start_time = time.perf_counter()
+        self._log(f"  ✅ Loaded mouth timeline with {len(timeline_data)} segments")
     
     def generate_simple_eye_timeline(self, duration_seconds=30):
         timeline = []
@@ -433,19 +662,22 @@ class CharacterRig:
             ("1_center", 3.0), ("1_down", 1.0),
         ]
         
-        all_variants = list(self.eye_variants.variants.keys())
+        # Drop states this character has no sprite for (once, not per cycle)
+        available = set(self.eye_variants.variants)
+        states = [(state, duration) for state, duration in states if state in available]
+        if not states:
+            return timeline
         
         while current_time < duration_seconds:
             for state, duration in states:
                 if current_time >= duration_seconds:
                     break
-                if state in all_variants:
-                    timeline.append({
-                        "variant": state,
-                        "start": current_time,
-                        "duration": duration
-                    })
-                    current_time += duration
+                timeline.append({
+                    "variant": state,
+                    "start": current_time,
+                    "duration": duration
+                })
+                current_time += duration
         
         return timeline
     
@@ -459,70 +691,77 @@ class CharacterRig:
     
     def set_body_scale(self, scale: float):
         """Scale the entire body"""
-        self.get_bone("Body").set_scale(scale)
+        self._body_bone.set_scale(scale)
     
     def set_head_rotation(self, angle: float):
         """Rotate the head (and all facial features with it)"""
-        self.get_bone("Head").set_rotation(angle)
+        self._head_bone.set_rotation(angle)
     
     def set_head_position_offset(self, x: float, y: float):
         """Move head relative to body (for bobbing, etc.)"""
-        head = self.get_bone("Head")
-        base_y = -self.body_sprite.get_height() // 2 - 100
-        head.set_position(x, base_y + y)
+        self._head_bone.set_position(x, self._head_base_y + y)
     
     def set_eye_variant(self, variant_name: str):
         """Change eye sprite (for different directions, open/closed)"""
-        if self.eye_variants.set_variant(variant_name):
-            self.get_bone("Eyes").sprite = self.eye_variants.get_sprite()
+        idx = self.eye_variants.name_to_idx.get(variant_name)
+        if idx is not None:
+            self.set_eye_variant_idx(idx)
+    
+    def set_eye_variant_idx(self, idx: int):
+        """Change eye sprite by index into eye_variants (see SpriteVariant.names)"""
+        # Timelines re-send the active variant every frame; nothing to swap then
+        if idx == self.eye_variants.current_idx:
+            return
+        self._eyes_bone.sprite = self.eye_variants.select_idx(idx)
     
     def set_mouth_variant(self, variant_name: str):
         """Change mouth sprite (for different expressions)"""
-        if self.mouth_variants.set_variant(variant_name):
-            self.get_bone("Mouth").sprite = self.mouth_variants.get_sprite()
+        idx = self.mouth_variants.name_to_idx.get(variant_name)
+        if idx is not None:
+            self.set_mouth_variant_idx(idx)
     
-    def set_eyebrow_height(self, offset: float):
-        """Move eyebrows up/down (for expressions)"""
-        eyebrow = self.get_bone("Eyebrows")
-        eyebrow.set_position(0, -50 + offset)
+    def set_mouth_variant_idx(self, idx: int):
+        """Change mouth sprite by index into mouth_variants (see SpriteVariant.names)"""
+        if idx == self.mouth_variants.current_idx:
+            return
+        self._mouth_bone.sprite = self.mouth_variants.select_idx(idx)
     
-
-
     def set_arm_joint_rotation(self, side: str, shoulder_angle: float, elbow_angle: float):
+        arm = self._arms.get(side) or self._arms.get(side[0].upper())
+        if arm is None:
+            return
         
-        side_char = side[0].upper() 
-        
-        shoulder_bone = self.get_bone(f"Shoulder_{side_char}")
-        elbow_bone = self.get_bone(f"Elbow_{side_char}")
-        
-        if shoulder_bone:
-            shoulder_bone.set_rotation(shoulder_angle)
-        if elbow_bone:
-            elbow_bone.set_rotation(elbow_angle)
+        shoulder_bone, elbow_bone = arm
+        shoulder_bone.set_rotation(shoulder_angle)
+        elbow_bone.set_rotation(elbow_angle)
 
     def set_hand_variant(self, side: str, variant_name: str):
-        if side.lower() == 'left':
-            hand_variants = self.l_hand_variants
-            hand_bone_name = "Hand_L"
-        elif side.lower() == 'right':
-            hand_variants = self.r_hand_variants
-            hand_bone_name = "Hand_R"
-        else:
+        hand = self._hands.get(side) or self._hands.get(side.lower())
+        if hand is None:
             return
-
-  
-        if hand_variants.set_variant(variant_name):
-            self.get_bone(hand_bone_name).sprite = hand_variants.get_sprite()
         
-    def update(self):
-        """Update all bone transforms and animations (call once per frame)"""
-   
-        self.update_blink_animation()
+        hand_variants, hand_bone = hand
+        sprite = hand_variants.select(variant_name)
+        if sprite is not None:
+            hand_bone.sprite = sprite
+        
+    def update(self, now=None):
+        """
+        Update all bone transforms and animations (call once per frame).
+        
+        Args:
+            now: time.perf_counter() timestamp for this frame (read once here if None)
+        """
+        if now is None:
+            now = time.perf_counter()
+        
+        self.update_blink_animation(now)
         
         if self.eye_timeline_enabled:
-            self.update_eye_timeline()
+            self.update_eye_timeline(now=now)
         
-        self.root.update()
+        # Only bones that moved (and their descendants) are recomputed
+        self.skeleton.update()
     
     def draw(self, screen: pygame.Surface, debug: bool = False):
         """Draw the entire character"""
@@ -530,27 +769,24 @@ class CharacterRig:
     
     def print_hierarchy(self):
         """Print the bone structure for debugging"""
-        def print_bone(bone, indent=0):
-            print("  " * indent + f"└─ {bone.name}")
-            for child in bone.children:
-                print_bone(child, indent + 1)
-        
         print("\n=== Character Bone Hierarchy ===")
-        print_bone(self.root)
+        stack = [(self.root, 0)]
+        while stack:
+            bone, indent = stack.pop()
+            print("  " * indent + f"└─ {bone.name}")
+            stack.extend((child, indent + 1) for child in reversed(bone.children))
         print("================================\n")
 
     def set_eyebrow_height(self, offset_y: float):
+        """Move eyebrows up/down (for expressions)"""
         base_y = -30 
         
-        eyebrow = self.get_bone("Eyebrows")
-        if eyebrow:
-            current_x = eyebrow.local_transform.position[0]
-            eyebrow.set_position(current_x, base_y + offset_y)
+        eyebrow = self._eyebrow_bone
+        current_x = eyebrow.local_transform.position[0]
+        eyebrow.set_position(current_x, base_y + offset_y)
             
     def set_face_scale(self, scale: float):
-        mouth = self.get_bone("Mouth")
-        if mouth:
-            mouth.set_scale(scale, scale)
+        self._mouth_bone.set_scale(scale, scale)
 
 
 # --- Arm Tuning Tool ---
@@ -624,21 +860,15 @@ if __name__ == "__main__":
         target_bone_name = tune_targets[current_target_index]
         target_bone = character.get_bone(target_bone_name)
         
-        if target_bone:
+        # Key states are 0/1, so opposite arrows cancel without branching
+        dx = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+        dy = keys[pygame.K_DOWN] - keys[pygame.K_UP]
+        
+        if target_bone and (dx or dy):
             current_speed = move_speed * (fast_multiplier if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT] else 1.0)
             
             cx, cy = target_bone.local_transform.position
-            
-            if keys[pygame.K_LEFT]:
-                cx -= current_speed
-            if keys[pygame.K_RIGHT]:
-                cx += current_speed
-            if keys[pygame.K_UP]:
-                cy -= current_speed
-            if keys[pygame.K_DOWN]:
-                cy += current_speed
-                
-            target_bone.local_transform.position = (cx, cy)
+            target_bone.set_position(cx + dx * current_speed, cy + dy * current_speed)
 
         character.update()
         
@@ -0,0 +1,108 @@
+"""
+Bone Kernel
+===========
+Per-frame world-matrix pass over a flattened (breadth-first) bone hierarchy.
+Compiled with numba when it is installed; otherwise a numpy version with the
+same signature is used.
+
+Arrays (N = number of bones, parents always before children):
+    parent_idx: int32[N], -1 for the root
+    trs:        float64[N, 5], rows of [tx, ty, rotation_deg, sx, sy]
+    dirty:      bool[N], bones whose local transform changed
+    world:      float64[N, 3, 3], updated in place
+    world_rs:   float64[N, 3], updated in place: accumulated [rotation_deg, sx, sy]
+                (what draw() needs; exact for the uniform scales this rig uses)
+    changed:    bool[N], out: bones whose world matrix was recomputed
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _update_world_numpy(parent_idx, trs, dirty, world, world_rs, changed):
+    """Vectorised local matrices, then one matmul per bone that needs it"""
+    rad = np.radians(trs[:, 2])
+    c, s = np.cos(rad), np.sin(rad)
+    local = np.zeros((len(trs), 3, 3))
+    local[:, 0, 0] = c * trs[:, 3]
+    local[:, 0, 1] = -s * trs[:, 4]
+    local[:, 0, 2] = trs[:, 0]
+    local[:, 1, 0] = s * trs[:, 3]
+    local[:, 1, 1] = c * trs[:, 4]
+    local[:, 1, 2] = trs[:, 1]
+    local[:, 2, 2] = 1.0
+    # Pure grouping bones just inherit the parent's space
+    identity = np.all(trs == (0.0, 0.0, 0.0, 1.0, 1.0), axis=1)
+
+    for i, parent in enumerate(parent_idx):
+        if not (dirty[i] or (parent >= 0 and changed[parent])):
+            changed[i] = False
+            continue
+        changed[i] = True
+        if parent < 0:
+            world[i] = local[i]
+            world_rs[i] = trs[i, 2:5]
+        elif identity[i]:
+            world[i] = world[parent]
+            world_rs[i] = world_rs[parent]
+        else:
+            np.matmul(world[parent], local[i], out=world[i])
+            world_rs[i, 0] = world_rs[parent, 0] + trs[i, 2]
+            np.multiply(world_rs[parent, 1:3], trs[i, 3:5], out=world_rs[i, 1:3])
+
+
+def _update_world_loop(parent_idx, trs, dirty, world, world_rs, changed):
+    """Scalar version of the same pass, written for numba"""
+    for i in range(trs.shape[0]):
+        p = parent_idx[i]
+        if not (dirty[i] or (p >= 0 and changed[p])):
+            changed[i] = False
+            continue
+        changed[i] = True
+
+        rad = math.radians(trs[i, 2])
+        c = math.cos(rad)
+        s = math.sin(rad)
+        a = c * trs[i, 3]
+        b = -s * trs[i, 4]
+        d = s * trs[i, 3]
+        e = c * trs[i, 4]
+        tx = trs[i, 0]
+        ty = trs[i, 1]
+
+        if p < 0:
+            world_rs[i, 0] = trs[i, 2]
+            world_rs[i, 1] = trs[i, 3]
+            world_rs[i, 2] = trs[i, 4]
+            world[i, 0, 0] = a
+            world[i, 0, 1] = b
+            world[i, 0, 2] = tx
+            world[i, 1, 0] = d
+            world[i, 1, 1] = e
+            world[i, 1, 2] = ty
+        else:
+            world_rs[i, 0] = world_rs[p, 0] + trs[i, 2]
+            world_rs[i, 1] = world_rs[p, 1] * trs[i, 3]
+            world_rs[i, 2] = world_rs[p, 2] * trs[i, 4]
+            # Affine: the parent's bottom row is always (0, 0, 1)
+            for r in range(2):
+                m0 = world[p, r, 0]
+                m1 = world[p, r, 1]
+                m2 = world[p, r, 2]
+                world[i, r, 0] = m0 * a + m1 * d
+                world[i, r, 1] = m0 * b + m1 * e
+                world[i, r, 2] = m0 * tx + m1 * ty + m2
+        world[i, 2, 0] = 0.0
+        world[i, 2, 1] = 0.0
+        world[i, 2, 2] = 1.0
+
+
+if njit is not None:
+    update_world = njit(cache=True)(_update_world_loop)
+else:
+    update_world = _update_world_numpy
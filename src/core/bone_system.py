@@ -5,12 +5,38 @@ This implements a hierarchical bone structure where each bone's transform
 is relative to its parent, enabling natural character animation.
 """
 
+import math
 import numpy as np
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List, Tuple
 import pygame
 
 
+@lru_cache(maxsize=1024)
+def _transform_matrix(px: float, py: float, rotation: float, sx: float, sy: float) -> np.ndarray:
+    """
+    T @ R @ S (scale -> rotate -> translate), multiplied out by hand. Cached:
+    rest-pose bones ask for the same matrix every frame. The result is shared,
+    so it is returned read-only.
+    """
+    rad = math.radians(rotation)
+    c, s = math.cos(rad), math.sin(rad)
+    m = np.array([
+        [c * sx, -s * sy, px],
+        [s * sx, c * sy, py],
+        [0.0, 0.0, 1.0]
+    ])
+    m.setflags(write=False)
+    return m
+
+
+def _empty_atlas(step: float) -> List[Optional[pygame.Surface]]:
+    """One slot per multiple of `step` degrees; Bone.draw() renders each on first use"""
+    return [None] * int(round(360 / step))
+
+
 @dataclass
 class Transform:
     """Represents a 2D transformation (position, rotation, scale)"""
@@ -18,33 +44,15 @@ class Transform:
     rotation: float = 0  # degrees
     scale: Tuple[float, float] = (1.0, 1.0)  # (sx, sy) scale factors
     
+    def is_identity(self) -> bool:
+        """True if this transform leaves its parent's space unchanged"""
+        return self.position == (0, 0) and self.rotation == 0 and self.scale == (1.0, 1.0)
+    
     def to_matrix(self) -> np.ndarray:
-        """Convert transform to 3x3 transformation matrix"""
-        # Translation matrix
-        T = np.array([
-            [1, 0, self.position[0]],
-            [0, 1, self.position[1]],
-            [0, 0, 1]
-        ])
-        
-        # Rotation matrix (in radians)
-        angle = np.radians(self.rotation)
-        c, s = np.cos(angle), np.sin(angle)
-        R = np.array([
-            [c, -s, 0],
-            [s, c, 0],
-            [0, 0, 1]
-        ])
-        
-        # Scale matrix
-        S = np.array([
-            [self.scale[0], 0, 0],
-            [0, self.scale[1], 0],
-            [0, 0, 1]
-        ])
-        
-        # Combine: Scale -> Rotate -> Translate
-        return T @ R @ S
+        """Convert transform to 3x3 transformation matrix (shared, read-only)"""
+        px, py = self.position
+        sx, sy = self.scale
+        return _transform_matrix(px, py, self.rotation, sx, sy)
 
 
 class Bone:
@@ -56,6 +64,11 @@ class Bone:
     - Child bones
     """
     
+    # LRU of scaled + rotated sprites shared by all bones: (sprite, sx, sy, angle) -> (Surface, w, h)
+    SPRITE_CACHE_SIZE = 256
+    _sprite_cache: "OrderedDict[tuple, Tuple[pygame.Surface, int, int]]" = OrderedDict()
+    _debug_font: Optional[pygame.font.Font] = None
+    
     def __init__(
         self,
         name: str,
@@ -72,16 +85,62 @@ class Bone:
         self.children: List[Bone] = []
         
         # Cached world transform (updated each frame)
+        self._local_matrix: Optional[np.ndarray] = None
         self._world_matrix: Optional[np.ndarray] = None
         self._world_position: Optional[Tuple[float, float]] = None
+        # Accumulated world rotation (degrees) and scale, read by draw()
+        self._world_rotation: Optional[float] = None
+        self._world_scale: Optional[Tuple[float, float]] = None
+        
+        # Set by the transform setters, cleared by update()
+        self._dirty = True
+        
+        # Optional [tx, ty, rotation, sx, sy] row in an owner's flat array (see bind_trs)
+        self._trs: Optional[np.ndarray] = None
+        
+        # Lazily built pre-order list and name -> bone map of this subtree
+        self._flat: Optional[List['Bone']] = None
+        self._name_index: Optional[dict] = None
+        
+        # Optional pre-rotated copies of the sprite(s) (see use_rotation_atlas)
+        self._rotation_atlas: Optional[dict] = None
+        self._atlas_step = 0.0
+        self._atlas_variants: Optional['SpriteVariant'] = None
+        
+        # Rendered debug label (see draw(debug=True))
+        self._name_text: Optional[pygame.Surface] = None
     
     def add_child(self, child: 'Bone'):
         """Add a child bone to this bone"""
         child.parent = self
         self.children.append(child)
+        
+        # The subtree changed for this bone and every ancestor
+        bone = self
+        while bone is not None:
+            bone._flat = None
+            bone._name_index = None
+            bone = bone.parent
+    
+    def _subtree(self) -> List['Bone']:
+        """This bone and all descendants in pre-order (draw order), cached until add_child"""
+        if self._flat is None:
+            flat = []
+            stack = [self]
+            while stack:
+                bone = stack.pop()
+                flat.append(bone)
+                stack.extend(reversed(bone.children))
+            self._flat = flat
+        return self._flat
     
     def get_world_matrix(self) -> np.ndarray:
         """Calculate world transformation matrix (relative to root)"""
+        if self.local_transform.is_identity():
+            # Pure grouping bones (e.g. Body, Face) just inherit the parent's space
+            if self.parent is None:
+                return np.identity(3)
+            return self.parent.get_world_matrix()
         if self.parent is None:
             return self.local_transform.to_matrix()
         else:
@@ -92,62 +151,183 @@ class Bone:
         world_mat = self.get_world_matrix()
         return (world_mat[0, 2], world_mat[1, 2])
     
+    def bind_trs(self, row: np.ndarray):
+        """
+        Mirror this bone's local transform into a row of an owner's array
+        (CharacterRig keeps one row per bone). The setters keep it in sync.
+        """
+        t = self.local_transform
+        row[:] = (t.position[0], t.position[1], t.rotation, t.scale[0], t.scale[1])
+        self._trs = row
+    
     def set_position(self, x: float, y: float):
         """Set local position relative to parent"""
         self.local_transform.position = (x, y)
+        if self._trs is not None:
+            self._trs[0:2] = x, y
+        self._dirty = True
     
     def set_rotation(self, angle: float):
         """Set local rotation in degrees"""
         self.local_transform.rotation = angle
+        if self._trs is not None:
+            self._trs[2] = angle
+        self._dirty = True
     
     def set_scale(self, sx: float, sy: float = None):
         """Set local scale"""
         if sy is None:
             sy = sx
         self.local_transform.scale = (sx, sy)
+        if self._trs is not None:
+            self._trs[3:5] = sx, sy
+        self._dirty = True
     
-    def update(self):
-        """Update cached world transforms (call this once per frame on root)"""
-        self._world_matrix = self.get_world_matrix()
-        self._world_position = self.get_world_position()
-        
-        for child in self.children:
-            child.update()
+    def use_rotation_atlas(self, step: float = 5.0, variants: Optional['SpriteVariant'] = None):
+        """
+        Let draw() reuse the nearest angle bucket instead of rotating each frame.
+        Covers the current sprite, or each sprite of `variants` once it is shown
+        (see SpriteVariant.rotations). Buckets are rendered the first time they
+        are drawn. Other sprites rotate as usual.
+        """
+        if variants is None:
+            self._rotation_atlas = {self.sprite: _empty_atlas(step)}
+        else:
+            self._rotation_atlas = {}
+        self._atlas_step = step
+        self._atlas_variants = variants
+    
+    def _variant_atlas(self) -> Optional[List[Optional[pygame.Surface]]]:
+        """Angle table for the shown variant, or None if the sprite isn't one of them"""
+        variants = self._atlas_variants
+        if self.sprite is not variants.get_sprite():
+            return None
+        atlas = variants.rotations(variants.current, self._atlas_step)
+        self._rotation_atlas[self.sprite] = atlas
+        return atlas
+    
+    def is_dirty(self) -> bool:
+        """
+        True if the local transform changed (through a setter) since the last update().
+        Writing local_transform fields directly bypasses this flag.
+        """
+        return self._dirty
+    
+    def set_world_matrix(self, world_matrix: np.ndarray, rotation: Optional[float] = None,
+                         scale: Optional[Tuple[float, float]] = None):
+        """
+        Store a world transform computed outside the tree walk (see Skeleton.update).
+        Without rotation/scale, draw() decomposes the matrix instead.
+        """
+        self._world_matrix = world_matrix
+        self._world_position = (world_matrix[0, 2], world_matrix[1, 2])
+        self._world_rotation = rotation
+        self._world_scale = scale
+        self._dirty = False
+    
+    def update(self, parent_world: Optional[np.ndarray] = None):
+        """
+        Update cached world transforms (call this once per frame on root).
+        Each bone composes its local matrix onto the parent's cached one, so the
+        whole tree costs one matrix product per bone. Iterates the flat pre-order
+        list (parents before children) instead of recursing.
+        """
+        self._update_own(parent_world)
+        for bone in self._subtree()[1:]:
+            bone._update_own(bone.parent._world_matrix)
+    
+    def _update_own(self, parent_world: Optional[np.ndarray]):
+        """Refresh this bone's cached world transform from its parent's"""
+        if self._dirty or self._local_matrix is None:
+            self._local_matrix = self.local_transform.to_matrix()
+        t = self.local_transform
+        if parent_world is None:
+            self._world_matrix = self._local_matrix
+            self._world_rotation = t.rotation
+            self._world_scale = t.scale
+        else:
+            self._world_matrix = parent_world @ self._local_matrix
+            # Rotations add and scales multiply down the chain (exact for uniform scale)
+            parent = self.parent
+            self._world_rotation = parent._world_rotation + t.rotation
+            self._world_scale = (parent._world_scale[0] * t.scale[0],
+                                 parent._world_scale[1] * t.scale[1])
+        self._world_position = (self._world_matrix[0, 2], self._world_matrix[1, 2])
+        self._dirty = False
+    
+    def _cached_world_matrix(self) -> np.ndarray:
+        """World matrix from the last update(), computed on the spot if never updated"""
+        if self._world_matrix is None:
+            return self.get_world_matrix()
+        return self._world_matrix
     
     def draw(self, screen: pygame.Surface, debug=False):
         """
-        Draw this bone and all children recursively.
+        Draw this bone and all children (parents first, in pre-order).
         
         Args:
             screen: Pygame surface to draw on
             debug: If True, draw bone connections and pivot points
         """
+        for bone in self._subtree():
+            bone._draw_own(screen, debug)
+    
+    def _draw_own(self, screen: pygame.Surface, debug: bool):
+        """Draw just this bone's sprite (and debug markers)"""
+        # World transform cached by the last update()
+        # (as plain floats: scalar math is much cheaper than numpy scalar ops)
+        (m00, m01, tx), (m10, m11, ty) = self._cached_world_matrix()[:2].tolist()
+        world_pos = (tx, ty)
+        
         if self.sprite is not None:
-            # Get world position
-            world_pos = self.get_world_position()
-            
-            # Apply rotation and scale
-            world_mat = self.get_world_matrix()
-            
-            # Extract rotation angle from matrix
-            rotation_rad = np.arctan2(world_mat[1, 0], world_mat[0, 0])
-            rotation_deg = -np.degrees(rotation_rad)  # Negative for pygame
-            
-            # Extract scale
-            scale_x = np.sqrt(world_mat[0, 0]**2 + world_mat[1, 0]**2)
-            scale_y = np.sqrt(world_mat[0, 1]**2 + world_mat[1, 1]**2)
+            if self._world_scale is not None:
+                # Accumulated during update(), no matrix decomposition needed
+                rotation_deg = -self._world_rotation  # Negative for pygame
+                scale_x, scale_y = self._world_scale
+            else:
+                # Extract rotation angle from matrix
+                rotation_rad = math.atan2(m10, m00)
+                rotation_deg = -math.degrees(rotation_rad)  # Negative for pygame
+                
+                # Extract scale
+                scale_x = math.sqrt(m00 * m00 + m10 * m10)
+                scale_y = math.sqrt(m01 * m01 + m11 * m11)
             
             # Transform sprite
-            scaled_sprite = pygame.transform.scale(
-                self.sprite,
-                (int(self.sprite.get_width() * scale_x),
-                 int(self.sprite.get_height() * scale_y))
-            )
-            rotated_sprite = pygame.transform.rotate(scaled_sprite, rotation_deg)
+            atlas = self._rotation_atlas.get(self.sprite) if self._rotation_atlas is not None else None
+            if atlas is None and self._atlas_variants is not None:
+                atlas = self._variant_atlas()
+            if atlas is not None and abs(scale_x - 1.0) < 1e-6 and abs(scale_y - 1.0) < 1e-6:
+                # Unscaled: the nearest angle bucket is a plain blit
+                idx = int(round(rotation_deg / self._atlas_step)) % len(atlas)
+                rotated_sprite = atlas[idx]
+                if rotated_sprite is None:
+                    rotated_sprite = atlas[idx] = pygame.transform.rotate(self.sprite, idx * self._atlas_step)
+                w, h = rotated_sprite.get_size()
+            else:
+                # Quantized so slowly changing poses reuse the previous frame's resample
+                key = (self.sprite, round(scale_x, 2), round(scale_y, 2), round(rotation_deg, 1))
+                cache = Bone._sprite_cache
+                entry = cache.get(key)
+                if entry is None:
+                    _, qsx, qsy, qrot = key
+                    scaled_sprite = pygame.transform.scale(
+                        self.sprite,
+                        (int(self.sprite.get_width() * qsx),
+                         int(self.sprite.get_height() * qsy))
+                    )
+                    rotated_sprite = pygame.transform.rotate(scaled_sprite, qrot)
+                    w, h = rotated_sprite.get_size()
+                    cache[key] = (rotated_sprite, w, h)
+                    if len(cache) > Bone.SPRITE_CACHE_SIZE:
+                        cache.popitem(last=False)
+                else:
+                    cache.move_to_end(key)
+                    rotated_sprite, w, h = entry
             
             # Calculate anchor offset
-            anchor_x = rotated_sprite.get_width() * self.anchor_point[0]
-            anchor_y = rotated_sprite.get_height() * self.anchor_point[1]
+            anchor_x = w * self.anchor_point[0]
+            anchor_y = h * self.anchor_point[1]
             
             # Draw sprite
             screen.blit(
@@ -157,13 +337,13 @@ class Bone:
         
         # Debug visualization
         if debug:
-            world_pos = self.get_world_position()
             # Draw pivot point
             pygame.draw.circle(screen, (255, 0, 0), (int(world_pos[0]), int(world_pos[1])), 5)
             
             # Draw bone connection to parent
             if self.parent is not None:
-                parent_pos = self.parent.get_world_position()
+                parent_mat = self.parent._cached_world_matrix()
+                parent_pos = (parent_mat[0, 2], parent_mat[1, 2])
                 pygame.draw.line(
                     screen,
                     (0, 255, 0),
@@ -172,24 +352,22 @@ class Bone:
                     2
                 )
             
-            # Draw bone name
-            font = pygame.font.Font(None, 20)
-            text = font.render(self.name, True, (255, 255, 255))
-            screen.blit(text, (world_pos[0] + 10, world_pos[1] - 10))
-        
-        # Draw children
-        for child in self.children:
-            child.draw(screen, debug)
+            # Draw bone name (font loaded once, label rendered once per bone)
+            if self._name_text is None:
+                if Bone._debug_font is None:
+                    Bone._debug_font = pygame.font.Font(None, 20)
+                self._name_text = Bone._debug_font.render(self.name, True, (255, 255, 255))
+            screen.blit(self._name_text, (world_pos[0] + 10, world_pos[1] - 10))
     
     def find_bone(self, name: str) -> Optional['Bone']:
         """Find a bone by name in the hierarchy"""
-        if self.name == name:
-            return self
-        for child in self.children:
-            result = child.find_bone(name)
-            if result:
-                return result
-        return None
+        if self._name_index is None:
+            # Built from the pre-order list (first match wins, as before); reused until add_child
+            index = {}
+            for bone in self._subtree():
+                index.setdefault(bone.name, bone)
+            self._name_index = index
+        return self._name_index.get(name)
     
     def __repr__(self):
         return f"Bone('{self.name}', children={len(self.children)})"
@@ -212,25 +390,57 @@ class SpriteVariant:
         self.variants = variants
         self.default = default or list(variants.keys())[0]
         self.current = self.default
+        
+        # Integer-indexed table built once: sprites[i] is the surface for names[i]
+        self.names = list(variants)
+        self.sprites = [variants[name] for name in self.names]
+        self.name_to_idx = {name: i for i, name in enumerate(self.names)}
+        self.current_idx = self.name_to_idx[self.current]
+        
+        # name -> sprite rotated every `rotation_step` degrees, filled as drawn (see rotations)
+        self.rotated: dict[str, List[Optional[pygame.Surface]]] = {}
+        self.rotation_step = 0.0
+    
+    def rotations(self, name: str, step: float = 5.0) -> List[Optional[pygame.Surface]]:
+        """Angle table for one variant, created the first time that variant asks for it"""
+        if self.rotation_step != step:
+            self.rotated = {}
+            self.rotation_step = step
+        table = self.rotated.get(name)
+        if table is None:
+            table = self.rotated[name] = _empty_atlas(step)
+        return table
     
     def set_variant(self, name: str) -> bool:
         """
         Set current variant by name.
         Returns True if variant exists, False otherwise.
         """
-        if name in self.variants:
-            self.current = name
-            return True
-        return False
+        return self.select(name) is not None
     
     def get_sprite(self) -> pygame.Surface:
         """Get the current variant sprite"""
-        return self.variants[self.current]
+        return self.sprites[self.current_idx]
+    
+    def select(self, name: str) -> Optional[pygame.Surface]:
+        """
+        Set current variant and return its sprite in a single lookup.
+        Returns None (and keeps the current variant) if it doesn't exist.
+        """
+        idx = self.name_to_idx.get(name)
+        if idx is None:
+            return None
+        return self.select_idx(idx)
+    
+    def select_idx(self, idx: int) -> pygame.Surface:
+        """Set current variant by table index and return its sprite"""
+        self.current_idx = idx
+        self.current = self.names[idx]
+        return self.sprites[idx]
     
     def reset(self):
         """Reset to default variant"""
-        self.current = self.default
-
+        self.select(self.default)
 
 if __name__ == "__main__":
     # Example usage and testing
@@ -246,9 +456,11 @@ if __name__ == "__main__":
     body.add_child(head)
     
     # Print hierarchy
-    def print_hierarchy(bone, indent=0):
-        print("  " * indent + f"- {bone.name}")
-        for child in bone.children:
-            print_hierarchy(child, indent + 1)
+    def print_hierarchy(bone):
+        stack = [(bone, 0)]
+        while stack:
+            bone, indent = stack.pop()
+            print("  " * indent + f"- {bone.name}")
+            stack.extend((child, indent + 1) for child in reversed(bone.children))
     
     print_hierarchy(root)
@@ -0,0 +1,57 @@
+"""
+Skeleton (structure-of-arrays)
+==============================
+Flat view of a Bone tree for the per-frame world-transform pass. Bones are
+stored breadth-first, so every parent comes before its children, and their
+transforms live in contiguous arrays that the Bone setters write into.
+"""
+
+from typing import List
+import numpy as np
+
+from src.core.bone_system import Bone
+from src.core.bone_kernel import update_world
+
+
+class Skeleton:
+    """
+    Arrays (N bones, breadth-first order):
+        parents:   int32[N], index of each bone's parent (-1 for the root)
+        trs:       float64[N, 5], [tx, ty, rotation_deg, sx, sy] per bone
+        world:     float64[N, 3, 3], world matrices after update()
+        world_rs:  float64[N, 3], accumulated [rotation_deg, sx, sy] after update()
+    """
+
+    def __init__(self, root: Bone):
+        bones = [root]
+        parents = [-1]
+        for i, bone in enumerate(bones):
+            bones.extend(bone.children)
+            parents.extend([i] * len(bone.children))
+
+        n = len(bones)
+        self.bones: List[Bone] = bones
+        self.parents = np.array(parents, dtype=np.int32)
+
+        self.trs = np.zeros((n, 5))
+        for i, bone in enumerate(bones):
+            bone.bind_trs(self.trs[i])
+
+        self.world = np.empty((n, 3, 3))
+        self.world_rs = np.empty((n, 3))
+        self._changed = np.zeros(n, dtype=bool)
+
+    def update(self):
+        """
+        Recompute world matrices, skipping clean subtrees, and hand the new rows
+        back to their bones. A bone is recomputed if its own transform changed
+        or its parent's world matrix did.
+        """
+        bones = self.bones
+        dirty = np.fromiter((bone.is_dirty() for bone in bones), dtype=bool, count=len(bones))
+        update_world(self.parents, self.trs, dirty, self.world, self.world_rs, self._changed)
+
+        world, world_rs = self.world, self.world_rs
+        for i in np.flatnonzero(self._changed):
+            rotation, sx, sy = world_rs[i].tolist()
+            bones[i].set_world_matrix(world[i], rotation, (sx, sy))
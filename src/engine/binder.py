@@ -42,6 +42,9 @@ class BindingEngine:
         self.trigger_bindings = [
             ('beat', 'head_bob')     # Beat drives Head Bob
         ]
+        
+        # Bindings resolved to bound methods; rebuilt lazily after any change
+        self._bindings_dirty = True
 
     def set_binding(self, signal_name, effector_name):
         """API to change bindings at runtime (for UI)."""
@@ -52,38 +55,55 @@ class BindingEngine:
             self.trigger_bindings.append((signal_name, effector_name))
         else:
             self.continuous_bindings.append((signal_name, effector_name))
+        self._bindings_dirty = True
             
     def clear_bindings(self):
         self.continuous_bindings = []
         self.trigger_bindings = []
+        self._bindings_dirty = True
+
+    def _compile_bindings(self):
+        """Resolve the binding tables to call lists so update() does no name lookups."""
+        # Grouped by signal so each one is sampled once per frame however many effectors it drives
+        grouped = {}
+        for sig_name, eff_name in self.continuous_bindings:
+            if sig_name in self.signals and eff_name in self.effectors:
+                grouped.setdefault(sig_name, []).append(self.effectors[eff_name].update)
+        self._continuous_calls = [
+            (self.signals[sig_name].get_value, updates) for sig_name, updates in grouped.items()
+        ]
+        
+        trigger_effectors = [
+            self.effectors[eff_name]
+            for sig_name, eff_name in self.trigger_bindings
+            if sig_name == 'beat' and isinstance(self.effectors.get(eff_name), TriggerEffector)
+        ]
+        self._trigger_calls = [effector.trigger for effector in trigger_effectors]
+        self._trigger_ticks = [effector.tick for effector in trigger_effectors]
+        self._bindings_dirty = False
 
     def update(self, current_time, dt, character_rig):
         """
         Main loop call.
         """
+        if self._bindings_dirty:
+            self._compile_bindings()
+        
         # A. Process Continuous Bindings
-        for sig_name, eff_name in self.continuous_bindings:
-            if sig_name in self.signals and eff_name in self.effectors:
-                val = self.signals[sig_name].get_value(current_time)
-                self.effectors[eff_name].update(val, character_rig)
+        for get_value, updates in self._continuous_calls:
+            val = get_value(current_time)
+            for update in updates:
+                update(val, character_rig, dt)
                 
         # B. Process Trigger Bindings
-        # 1. Check trigger
+        # 1. Check trigger (always, so the beat cursor keeps pace with playback)
         if self.signals['beat'].check(current_time):
-            for sig_name, eff_name in self.trigger_bindings:
-                if sig_name == 'beat':
-                    self.effectors[eff_name].trigger()
+            for trigger in self._trigger_calls:
+                trigger()
         
         # 2. Update Trigger Animations (Decay logic)
-        for _, eff_name in self.trigger_bindings:
-            effector = self.effectors[eff_name]
-            
-            if hasattr(effector, 'update'):
-                try:
-                    # Trigger effectors need 'dt'
-                    effector.update(dt, character_rig)
-                except TypeError:
-                    pass
+        for tick in self._trigger_ticks:
+            tick(dt, character_rig)
 
     def remove_binding_by_effector(self, effector_id):
         """Remove any binding that targets this effector."""
@@ -93,4 +113,5 @@ class BindingEngine:
         ]
         self.trigger_bindings = [
             (s, e) for s, e in self.trigger_bindings if e != effector_id
-        ]
\ No newline at end of file
+        ]
+        self._bindings_dirty = True
\ No newline at end of file
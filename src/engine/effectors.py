@@ -4,17 +4,60 @@ Animation Effectors
 Classes that take a 0.0-1.0 input and drive CharacterRig properties.
 """
 import math
-import time
-import random
+
+# Below these a rig write is imperceptible; effectors skip it (and the
+# re-transform and sprite resample it would cause)
+SCALE_EPSILON = 1e-3
+POSITION_EPSILON = 0.5  # pixels
+
+
+def _hash32(x):
+    """
+    murmur3's 32-bit finalizer: consecutive integers map to unrelated-looking
+    values in every bit, so a modulo of the result doesn't cycle.
+    """
+    x &= 0xFFFFFFFF
+    x ^= x >> 16
+    x = (x * 0x85EBCA6B) & 0xFFFFFFFF
+    x ^= x >> 13
+    x = (x * 0xC2B2AE35) & 0xFFFFFFFF
+    x ^= x >> 16
+    return x
+
+
+__all__ = [
+    "Effector", "TriggerEffector",
+    "ArmDancer", "BodyPumper", "Floater", "FaceExpression",
+    "HeadBanger", "FootTapper", "SimpleLipSync",
+]
 
 # --- Base Class ---
 class Effector:
-    def update(self, value, character):
+    # Effectors are updated every frame: slots keep their state out of a
+    # per-instance __dict__ (subclasses list their own attributes)
+    __slots__ = ()
+    
+    # dt is the frame time in seconds; BindingEngine passes the real one
+    def update(self, value, character, dt=1/60):
+        pass
+
+
+class TriggerEffector(Effector):
+    """Fires on trigger() and animates the decay in tick(dt, character) every frame."""
+    __slots__ = ()
+
+    def trigger(self):
+        pass
+
+    def tick(self, dt, character):
         pass
 
 
 class ArmDancer(Effector):
     """Controls arm elevation and hand sprites based on intensity."""
+    __slots__ = ("current_shoulder", "current_elbow", "smoothing", "base_shoulder", "base_elbow",
+                 "range_shoulder", "range_elbow", "_hand_keys", "_prev_hand_variant")
+
     def __init__(self, smoothing=0.1):
         self.current_shoulder = 0.0
         self.current_elbow = 0.0
@@ -25,8 +68,12 @@ class ArmDancer(Effector):
         
         self.range_shoulder = 100.0  
         self.range_elbow = 80.0    
+        
+        # Hand variant -> (left, right) sprite names, built once
+        self._hand_keys = {v: (f"L_hand_{v}", f"R_hand_{v}") for v in ("rest", "curl", "open", "high")}
+        self._prev_hand_variant = None
 
-    def update(self, value, character):
+    def update(self, value, character, dt=1/60):
     
         target_shoulder = self.base_shoulder + (value * self.range_shoulder)
         
@@ -42,27 +89,39 @@ class ArmDancer(Effector):
         self.current_elbow += (target_elbow - self.current_elbow) * self.smoothing
         
         character.set_arm_joint_rotation("left", self.current_shoulder, self.current_elbow)
-        character.set_hand_variant("left", f"L_hand_{hand_variant}")
-        
         character.set_arm_joint_rotation("right", -self.current_shoulder, -self.current_elbow)
-        character.set_hand_variant("right", f"R_hand_{hand_variant}")
+        
+        # Hands only change when the intensity band does
+        if hand_variant != self._prev_hand_variant:
+            l_key, r_key = self._hand_keys[hand_variant]
+            character.set_hand_variant("left", l_key)
+            character.set_hand_variant("right", r_key)
+            self._prev_hand_variant = hand_variant
 
 class BodyPumper(Effector):
     """Scales the body size based on intensity."""
+    __slots__ = ("min_s", "max_s", "smoothing", "current_val", "_last_applied")
+
     def __init__(self, min_scale=0.95, max_scale=1.55):
         self.min_s = min_scale
         self.max_s = max_scale
         self.smoothing = 0.03 
         self.current_val = 0.0
+        self._last_applied = None
         
-    def update(self, value, character):
+    def update(self, value, character, dt=1/60):
         if value < 0.1: value = 0.0
         self.current_val += (value - self.current_val) * self.smoothing
         scale = self.min_s + (self.max_s - self.min_s) * self.current_val
+        if self._last_applied is not None and abs(scale - self._last_applied) < SCALE_EPSILON:
+            return
         character.set_body_scale(scale)
+        self._last_applied = scale
 
 class Floater(Effector):
     """Levitates the character vertically."""
+    __slots__ = ("max_offset", "smoothing", "current_val", "base_y", "idle_time")
+
     def __init__(self, max_offset=200):
         self.max_offset = max_offset
         self.smoothing = 0.02
@@ -70,7 +129,7 @@ class Floater(Effector):
         self.base_y = None 
         self.idle_time = 0.0
         
-    def update(self, value, character):
+    def update(self, value, character, dt=1/60):
         current_x, current_y = character.root.local_transform.position
         if self.base_y is None:
             self.base_y = current_y
@@ -81,6 +140,8 @@ class Floater(Effector):
         idle_offset = math.sin(self.idle_time) * 5
         target_y = self.base_y - music_offset + idle_offset
         
+        if abs(target_y - current_y) < POSITION_EPSILON:
+            return
         character.set_screen_position(current_x, target_y)
 
 class FaceExpression(Effector):
@@ -88,16 +149,20 @@ class FaceExpression(Effector):
     Controls facial features: Eyebrows height, Mouth scale.
     (Smoother & More Exaggerated Version)
     """
+    __slots__ = ("current_brow_offset", "current_scale", "smoothing", "_last_applied",
+                 "max_brow_raise", "max_mouth_scale")
+
     def __init__(self):
         self.current_brow_offset = 0.0
         self.current_scale = 1.0
         
         self.smoothing = 0.05
+        self._last_applied = None  # (brow_offset, scale)
         
         self.max_brow_raise = -60.0  
         self.max_mouth_scale = 3  
 
-    def update(self, value, character):
+    def update(self, value, character, dt=1/60):
         if value < 0.05: 
             value = 0.0
         else:
@@ -107,7 +172,7 @@ class FaceExpression(Effector):
         
         boosted_value = min(1.0, boosted_value)
         
-        exaggerated_value = math.pow(boosted_value, 2.0) 
+        exaggerated_value = boosted_value * boosted_value
         
         target_brow = exaggerated_value * self.max_brow_raise
         target_scale = 1.0 + (exaggerated_value * (self.max_mouth_scale - 1.0))
@@ -115,12 +180,20 @@ class FaceExpression(Effector):
         self.current_brow_offset += (target_brow - self.current_brow_offset) * self.smoothing
         self.current_scale += (target_scale - self.current_scale) * self.smoothing
         
+        last = self._last_applied
+        if (last is not None
+                and abs(self.current_brow_offset - last[0]) < POSITION_EPSILON
+                and abs(self.current_scale - last[1]) < SCALE_EPSILON):
+            return
         character.set_eyebrow_height(self.current_brow_offset)
         character.set_face_scale(self.current_scale)
+        self._last_applied = (self.current_brow_offset, self.current_scale)
 # --- 2. Trigger Effectors (Input: Boolean/Pulse) ---
 
-class HeadBanger(Effector):
+class HeadBanger(TriggerEffector):
     """Nods head on trigger. (Softer Decay)"""
+    __slots__ = ("timer", "duration", "active", "bob_amount", "current_offset")
+
     def __init__(self):
         self.timer = 0.0
         self.duration = 0.2 
@@ -132,7 +205,7 @@ class HeadBanger(Effector):
         self.active = True
         self.timer = self.duration
         
-    def update(self, dt, character):
+    def tick(self, dt, character):
         target_offset = 0.0
         
         if self.active:
@@ -141,7 +214,7 @@ class HeadBanger(Effector):
                 self.active = False
             else:
                 progress = self.timer / self.duration
-                target_offset = self.bob_amount * math.sin(progress * 3.14)
+                target_offset = self.bob_amount * math.sin(progress * math.pi)
 
         self.current_offset += (target_offset - self.current_offset) * 0.2
         
@@ -149,22 +222,32 @@ class HeadBanger(Effector):
 
 
 
-class FootTapper(Effector):
+class FootTapper(TriggerEffector):
     """
     Scales the legs/feet on beat trigger.
     """
+    __slots__ = ("scale_timer", "duration", "max_scale", "current_scale", "triggered",
+                 "_feet_bone", "_feet_owner")
+
     def __init__(self):
         self.scale_timer = 0.0
         self.duration = 0.25      
         self.max_scale = 1.2     
         self.current_scale = 1.0
         self.triggered = False
+        # "Feet" bone of the character it was resolved from (looked up once per rig)
+        self._feet_bone = None
+        self._feet_owner = None
 
     def trigger(self):
         self.triggered = True
         self.scale_timer = self.duration
 
-    def update(self, dt, character):
+    def tick(self, dt, character):
+        # At rest between beats there is nothing to animate
+        if not self.triggered and self.current_scale == 1.0:
+            return
+        
         target_scale = 1.0
         
         if self.triggered:
@@ -174,12 +257,17 @@ class FootTapper(Effector):
             else:
                 progress = self.scale_timer / self.duration
                 
-                target_scale = 1.0 + (self.max_scale - 1.0) * math.sin(progress * 3.14)
+                target_scale = 1.0 + (self.max_scale - 1.0) * math.sin(progress * math.pi)
 
     
         self.current_scale += (target_scale - self.current_scale) * 0.3
+        if not self.triggered and abs(self.current_scale - 1.0) < 0.001:
+            self.current_scale = 1.0  # settle exactly so the early return takes over
         
-        feet_bone = character.get_bone("Feet")
+        if self._feet_owner is not character:
+            self._feet_bone = character.get_bone("Feet")
+            self._feet_owner = character
+        feet_bone = self._feet_bone
         
         if feet_bone:
             feet_bone.set_scale(self.current_scale, self.current_scale)
@@ -187,24 +275,29 @@ class FootTapper(Effector):
 
 class SimpleLipSync(Effector):
     """
-    Simulates lip sync by switching random mouth shapes when volume is detected.
+    Simulates lip sync by switching pseudo-random mouth shapes when volume is detected.
     """
+    __slots__ = ("elapsed", "switch_interval", "_last_slot", "silence_timer", "silence_threshold",
+                 "open_mouths", "closed_mouth", "current_mouth", "_open_idx")
+
     def __init__(self):
-        self.last_switch_time = 0
+        self.elapsed = 0.0
         self.switch_interval = 0.6  
+        self._last_slot = -1  # switch_interval-sized time slot of the last switch
         self.silence_timer = 0.0 
         self.silence_threshold = 0.15 
         
-        self.open_mouths = ["1", "2", "3", "4"]
+        self.open_mouths = ("1", "2", "3", "4")
         self.closed_mouth = "Sil" 
         self.current_mouth = self.closed_mouth
+        self._open_idx = -1  # index into open_mouths, -1 while closed
 
-    def update(self, value, character):
-        now = time.time()
+    def update(self, value, character, dt=1/60):
+        self.elapsed += dt
         
         if value < 0.1:
             
-            self.silence_timer += 0.016 
+            self.silence_timer += dt
         else:
             
             self.silence_timer = 0.0
@@ -213,13 +306,20 @@ class SimpleLipSync(Effector):
             if self.current_mouth != self.closed_mouth:
                 character.set_mouth_variant(self.closed_mouth)
                 self.current_mouth = self.closed_mouth
+                self._open_idx = -1
         else:
             
-            if now - self.last_switch_time > self.switch_interval:
-                new_mouth = random.choice(self.open_mouths)
-                while new_mouth == self.current_mouth and len(self.open_mouths) > 1:
-                    new_mouth = random.choice(self.open_mouths)
+            # One shape per time slot (and straight away when the mouth opens);
+            # the slot number is hashed (_hash32) instead of drawing from an RNG
+            slot = int(self.elapsed / self.switch_interval)
+            if slot != self._last_slot or self._open_idx < 0:
+                count = len(self.open_mouths)
+                idx = _hash32(slot) % count
+                if idx == self._open_idx:
+                    idx = (idx + 1) % count
+                self._open_idx = idx
+                new_mouth = self.open_mouths[idx]
                 
                 character.set_mouth_variant(new_mouth)
                 self.current_mouth = new_mouth
-                self.last_switch_time = now
\ No newline at end of file
+                self._last_slot = slot
@@ -3,6 +3,7 @@ Signal Sources
 ==============
 Reads normalized data arrays and provides values synchronized to playback time.
 """
+from bisect import bisect_right
 
 class ContinuousSignal:
     def __init__(self, data_array, fps):
@@ -17,19 +18,28 @@ class ContinuousSignal:
         self.last_value = 0.0
 
     def get_value(self, current_time):
-        """Get the value at the specific time (in seconds)."""
+        """
+        Get the value at the specific time (in seconds), linearly interpolated
+        between analysis frames so it doesn't step at the analysis rate.
+        """
         if self.length == 0: 
             return 0.0
             
-        # Calculate index
-        idx = int(current_time * self.fps)
+        # Fractional frame position
+        pos = current_time * self.fps
+        idx = int(pos)
         
         # Clamp to boundaries
-        if idx < 0: idx = 0
-        if idx >= self.length: idx = self.length - 1
+        if pos <= 0:
+            value = self.data[0]
+        elif idx >= self.length - 1:
+            value = self.data[-1]
+        else:
+            a = self.data[idx]
+            value = a + (self.data[idx + 1] - a) * (pos - idx)
         
-        self.last_value = self.data[idx]
-        return self.data[idx]
+        self.last_value = value
+        return value
 
 class TriggerSignal:
     def __init__(self, timestamp_list):
@@ -55,8 +65,9 @@ class TriggerSignal:
         next_time = self.timestamps[self.index]
         
         if current_time >= next_time:
-            # Trigger found! Advance index.
-            self.index += 1
+            # Trigger found! Advance past every beat already due, so a seek or a
+            # long frame fires once instead of once per frame for each missed beat
+            self.index = bisect_right(self.timestamps, current_time, self.index + 1)
             return True
             
         return False
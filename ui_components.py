@@ -30,6 +30,7 @@ class Button:
         self.active = False   
         
         self.radius = 15
+        self._text_cache = {}  # (text, text colour) -> rendered label
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -76,8 +77,11 @@ class Button:
             pygame.draw.rect(screen, (255, 255, 255), self.rect, 3, border_radius=self.radius)
             pygame.draw.rect(screen, COLOR_BTN_HOVER, self.rect, 1, border_radius=self.radius)
 
-        # Draw text
-        text_surf = self.font.render(self.text, True, text_col)
+        # Draw text (one render per text and colour, reused across frames)
+        text_surf = self._text_cache.get((self.text, text_col))
+        if text_surf is None:
+            text_surf = self.font.render(self.text, True, text_col)
+            self._text_cache[(self.text, text_col)] = text_surf
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -136,19 +140,26 @@ class Label:
         self.text = text
         self.color = color
         self.font = pygame.font.SysFont(FONT_NAME, size, bold=bold)
+        self._surf = None
 
     def set_text(self, text):
-        self.text = text
+        if text != self.text:
+            self.text = text
+            self._surf = None
 
     def draw(self, screen):
-        surf = self.font.render(self.text, True, self.color)
-        screen.blit(surf, (self.x, self.y))
+        # Only re-render when the text actually changed
+        if self._surf is None:
+            self._surf = self.font.render(self.text, True, self.color)
+        screen.blit(self._surf, (self.x, self.y))
 
 class Panel:
     def __init__(self, x, y, width, height, title=""):
         self.rect = pygame.Rect(x, y, width, height)
         self.title = title
         self.font = pygame.font.SysFont(FONT_NAME, 24, bold=True)
+        self._title_surf = None
+        self._title_text = None  # title the cached surface was rendered from
 
     def draw(self, screen):
         # Draw white card background
@@ -158,7 +169,11 @@ class Panel:
         pygame.draw.rect(screen, (255, 255, 255), self.rect, 2, border_radius=20)
         
         if self.title:
-            title_surf = self.font.render(self.title, True, COLOR_TEXT_MAIN)
+            # Only re-render when the title actually changed
+            if self._title_text != self.title:
+                self._title_surf = self.font.render(self.title, True, COLOR_TEXT_MAIN)
+                self._title_text = self.title
+            title_surf = self._title_surf
             # Center the title
             title_rect = title_surf.get_rect(centerx=self.rect.centerx, top=self.rect.y + 25)
             screen.blit(title_surf, title_rect)